@@ -0,0 +1,113 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+CLAIM_FIELDS = ('username', 'is_active', 'is_staff')
+# Номер «поколения» токенов пользователя: revoke_user увеличивает его, и все токены
+# со старым номером отклоняются. Сравниваем счётчики, а не время, чтобы не зависеть от часов воркеров
+GENERATION_CLAIM = 'auth_gen'
+
+GENERATION_KEY = 'accounts:jwt:generation:{}'
+USER_KEY = 'accounts:user:{}'
+
+
+def _generation_ttl():
+    # Запись живёт, пока жив хотя бы один токен её поколения; если она пропала,
+    # счётчик сбрасывается в 0 и токены с ненулевым номером отклоняются
+    lifetime = api_settings.REFRESH_TOKEN_LIFETIME + api_settings.ACCESS_TOKEN_LIFETIME
+    return int(lifetime.total_seconds())
+
+
+def get_generation(user_id):
+    return caches['jwt_revocations'].get(GENERATION_KEY.format(user_id), 0)
+
+
+def add_user_claims(token, user, generation=None):
+    for field in CLAIM_FIELDS:
+        token[field] = getattr(user, field)
+    if generation is None:
+        generation = get_generation(user.pk)
+        if generation:
+            caches['jwt_revocations'].touch(GENERATION_KEY.format(user.pk), _generation_ttl())
+    token[GENERATION_CLAIM] = generation
+    return token
+
+
+def revoke_user(user_id):
+    # Сигналы в accounts.signals вызывают это только из Model.save()/delete().
+    # QuerySet.update(), bulk_update() и сырой SQL их обходят: после таких изменений
+    # нужно вызвать revoke_user самим (например, manage.py revoke_tokens).
+    revocations = caches['jwt_revocations']
+    key = GENERATION_KEY.format(user_id)
+    revocations.add(key, 0, timeout=_generation_ttl())
+    revocations.incr(key)
+    revocations.touch(key, _generation_ttl())
+    forget_cached_user(user_id)
+
+
+def is_revoked(token):
+    return token.get(GENERATION_CLAIM, 0) != get_generation(token.get(api_settings.USER_ID_CLAIM))
+
+
+def get_cached_user(user_id):
+    key = USER_KEY.format(user_id)
+    user = cache.get(key)
+    if user is None:
+        try:
+            user = get_user_model().objects.get(pk=user_id)
+        except get_user_model().DoesNotExist:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        cache.set(key, user, timeout=settings.JWT_USER_CACHE_TTL)
+    return user
+
+
+def forget_cached_user(user_id):
+    cache.delete(USER_KEY.format(user_id))
+
+
+class ClaimsUser(TokenUser):
+    """Пользователь, собранный из claims access-токена без запроса в БД."""
+
+    def __str__(self):
+        return self.username
+
+    @cached_property
+    def id(self):
+        return get_user_model()._meta.pk.to_python(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def is_active(self):
+        return self.token.get('is_active', True)
+
+
+def get_full_user(user):
+    # request.user бывает обычным User: при JWTAuthentication и для токенов без claims
+    if isinstance(user, ClaimsUser):
+        return get_cached_user(user.id)
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        if is_revoked(validated_token):
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        # Токены, выпущенные до появления claims, проверяем по БД как раньше
+        if not all(field in validated_token for field in CLAIM_FIELDS):
+            return super().get_user(validated_token)
+
+        user = ClaimsUser(validated_token)
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
@@ -0,0 +1,27 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.authentication import revoke_user
+
+
+class Command(BaseCommand):
+    help = 'Отзывает ранее выданные JWT пользователей (например, после QuerySet.update())'
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='*')
+        parser.add_argument('--inactive', action='store_true', help='отозвать токены всех неактивных пользователей')
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.none()
+        if options['usernames']:
+            users = get_user_model().objects.filter(username__in=options['usernames'])
+            missing = set(options['usernames']) - set(users.values_list('username', flat=True))
+            if missing:
+                raise CommandError(f"unknown users: {', '.join(sorted(missing))}")
+        if options['inactive']:
+            users = users | get_user_model().objects.filter(is_active=False)
+
+        ids = list(users.values_list('pk', flat=True))
+        for user_id in ids:
+            revoke_user(user_id)
+        self.stdout.write(self.style.SUCCESS(f'revoked tokens for {len(ids)} user(s)'))
@@ -1,4 +1,11 @@
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import GENERATION_CLAIM, add_user_claims, is_revoked
 
 class RegisterRequestSerializer(serializers.Serializer):
     username = serializers.CharField(max_length=150)
@@ -6,4 +13,31 @@ class RegisterRequestSerializer(serializers.Serializer):
 
 class RegisterResponseSerializer(serializers.Serializer):
     id = serializers.IntegerField()
-    username = serializers.CharField(max_length=150)
\ No newline at end of file
+    username = serializers.CharField(max_length=150)
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    default_error_messages = {
+        'no_active_account': _('No active account found for the given token.'),
+    }
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+
+        user_id = refresh.get(api_settings.USER_ID_CLAIM)
+        user = get_user_model().objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        if is_revoked(refresh) or user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages['no_active_account'], code='no_active_account')
+
+        data = super().validate(attrs)
+
+        # Claims берём из БД, чтобы они отставали не больше чем на ACCESS_TOKEN_LIFETIME;
+        # поколение остаётся от логина, иначе обновление обходило бы deny-list
+        access = refresh.access_token_class(data['access'])
+        data['access'] = str(add_user_claims(access, user, generation=refresh.get(GENERATION_CLAIM, 0)))
+        return data
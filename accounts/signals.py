@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .authentication import CLAIM_FIELDS, forget_cached_user, revoke_user
+
+User = get_user_model()
+
+
+@receiver(pre_save, sender=User)
+def remember_claims(sender, instance, update_fields=None, **kwargs):
+    instance._old_claims = None
+    if instance.pk is None:
+        return
+    if update_fields is not None and not set(CLAIM_FIELDS) & set(update_fields):
+        return
+    instance._old_claims = User.objects.filter(pk=instance.pk).values(*CLAIM_FIELDS).first()
+
+
+@receiver(post_save, sender=User)
+def sync_claims(sender, instance, created, **kwargs):
+    forget_cached_user(instance.pk)
+    old = getattr(instance, '_old_claims', None)
+    if created or old is None:
+        return
+    if any(old[field] != getattr(instance, field) for field in CLAIM_FIELDS):
+        revoke_user(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def drop_claims(sender, instance, **kwargs):
+    revoke_user(instance.pk)
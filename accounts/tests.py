@@ -0,0 +1,156 @@
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from accounts.authentication import ClaimsUser, get_cached_user, get_full_user
+
+PASSWORD = 'tester_pass'
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username='tester', password=PASSWORD)
+
+
+def obtain(username='tester'):
+    resp = APIClient().post('/api/auth/token', {'username': username, 'password': PASSWORD}, format='json')
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def refresh(tokens):
+    return APIClient().post('/api/auth/token/refresh', {'refresh': tokens['refresh']}, format='json')
+
+
+def create_course(access):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+    return client.post('/api/courses/', {'title': 'Python'}, format='json')
+
+
+def auth_user_queries(queries):
+    return [q['sql'] for q in queries if 'auth_user' in q['sql']]
+
+
+def test_login_issues_claims(user):
+    access = AccessToken(obtain()['access'])
+    assert access['username'] == 'tester'
+    assert access['is_active'] is True
+    assert access['is_staff'] is False
+    assert access['auth_gen'] == 0
+
+
+def test_authenticated_request_skips_user_query(user):
+    tokens = obtain()
+    with CaptureQueriesContext(connection) as ctx:
+        assert create_course(tokens['access']).status_code == 201
+    assert auth_user_queries(ctx.captured_queries) == []
+
+
+def deactivate(user):
+    user.is_active = False
+    user.save()
+
+
+def delete(user):
+    user.delete()
+
+
+def promote(user):
+    user.is_staff = True
+    user.save()
+
+
+@pytest.mark.parametrize('change', [deactivate, delete, promote])
+def test_changed_user_is_rejected(user, change):
+    tokens = obtain()
+    change(user)
+    assert create_course(tokens['access']).status_code == 401
+    assert refresh(tokens).status_code == 401
+
+
+def test_relogin_after_reactivation(user):
+    deactivate(user)
+    user.is_active = True
+    user.save()
+    tokens = obtain()
+    assert AccessToken(tokens['access'])['auth_gen'] == 2
+    assert create_course(tokens['access']).status_code == 201
+    assert refresh(tokens).status_code == 200
+
+
+def test_refresh_reloads_claims_without_deny_list(user):
+    tokens = obtain()
+    User.objects.filter(pk=user.pk).update(is_staff=True)
+    resp = refresh(tokens)
+    assert resp.status_code == 200
+    access = AccessToken(resp.json()['access'])
+    assert access['is_staff'] is True
+    assert access['auth_gen'] == AccessToken(tokens['access'])['auth_gen']
+
+    User.objects.filter(pk=user.pk).update(is_active=False)
+    assert refresh(tokens).status_code == 401
+
+
+def test_revoke_tokens_command_after_bulk_update(user):
+    tokens = obtain()
+    User.objects.filter(pk=user.pk).update(is_active=False)
+    assert create_course(tokens['access']).status_code == 201
+
+    call_command('revoke_tokens', '--inactive')
+    assert create_course(tokens['access']).status_code == 401
+
+
+def test_pre_claims_token_falls_back_to_db(user):
+    access = str(RefreshToken.for_user(user).access_token)
+    with CaptureQueriesContext(connection) as ctx:
+        assert create_course(access).status_code == 201
+    assert auth_user_queries(ctx.captured_queries)
+
+    User.objects.filter(pk=user.pk).update(is_active=False)
+    assert create_course(access).status_code == 401
+
+
+def test_cached_user_missing_raises_authentication_failed(user):
+    user_id = user.pk
+    User.objects.filter(pk=user_id).delete()
+    with pytest.raises(AuthenticationFailed):
+        get_cached_user(user_id)
+
+
+def test_get_full_user_for_claims_and_model_users(user):
+    claims_user = ClaimsUser(AccessToken(obtain()['access']))
+    assert get_full_user(claims_user) == user
+    assert get_full_user(user) is user
+
+
+def test_refresh_rotation_keeps_claims(user, monkeypatch):
+    monkeypatch.setattr(jwt_serializers.api_settings, 'ROTATE_REFRESH_TOKENS', True)
+    tokens = obtain()
+    resp = refresh(tokens)
+    assert resp.status_code == 200
+    assert 'refresh' in resp.json()
+    assert AccessToken(resp.json()['access'])['username'] == 'tester'
+
+
+def test_lost_generation_rejects_newer_tokens(user):
+    deactivate(user)
+    user.is_active = True
+    user.save()
+    tokens = obtain()
+    caches['jwt_revocations'].clear()
+    assert create_course(tokens['access']).status_code == 401
+    assert refresh(tokens).status_code == 401
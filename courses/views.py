@@ -49,9 +49,9 @@ class LessonViewSet(viewsets.ModelViewSet):
 def complete_lesson(request, pk: int):
     lesson = get_object_or_404(Lesson, pk=pk)
     try:
-        progress = UserProgress.objects.create(user=request.user, lesson=lesson)
+        progress = UserProgress.objects.create(user_id=request.user.id, lesson=lesson)
     except IntegrityError:
-        progress = UserProgress.objects.get(user=request.user, lesson=lesson)
+        progress = UserProgress.objects.get(user_id=request.user.id, lesson=lesson)
     return Response(UserProgressSerializer(progress).data, status=status.HTTP_200_OK)
 
 @extend_schema(
@@ -126,7 +126,7 @@ def generate_task(request, pk: int):
 
     obj = GeneratedTask.objects.create(
         lesson=lesson,
-        user=request.user,
+        user_id=request.user.id,
         task_text=task_text,
         solution=solution,
     )
@@ -141,7 +141,7 @@ def generate_task(request, pk: int):
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def check_task(request, pk: int):
-    task = get_object_or_404(GeneratedTask, pk=pk, user=request.user)
+    task = get_object_or_404(GeneratedTask, pk=pk, user_id=request.user.id)
 
     payload = CheckTaskRequestSerializer(data=request.data)
     payload.is_valid(raise_exception=True)
@@ -79,8 +79,30 @@ USE_TZ = True
 STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Deny-list отозванных токенов держим в отдельном алиасе, чтобы его не вытесняли закешированные пользователи
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+    'jwt_revocations': env.cache('CACHE_URL', default='locmemcache://jwt-revocations'),
+}
+CACHES['jwt_revocations']['KEY_PREFIX'] = 'jwt_revocations'
+JWT_USER_CACHE_TTL = env.int('JWT_USER_CACHE_TTL', default=60)
+
+# Claims можно доверять только при общем для воркеров deny-list; локальный, файловый или dummy
+# кеш им не является, поэтому в проде остаёмся на JWTAuthentication, который проверяет пользователя в БД
+SHARED_CACHE_BACKENDS = (
+    'django.core.cache.backends.redis.RedisCache',
+    'django.core.cache.backends.memcached.PyMemcacheCache',
+    'django.core.cache.backends.memcached.PyLibMCCache',
+)
+JWT_CLAIMS_AUTH = DEBUG or CACHES['jwt_revocations']['BACKEND'] in SHARED_CACHE_BACKENDS
+if 'locmem' in CACHES['jwt_revocations']['BACKEND']:
+    CACHES['jwt_revocations'].setdefault('OPTIONS', {})['MAX_ENTRIES'] = 1_000_000
+
 REST_FRAMEWORK = {
-    'DEFAULT_AUTHENTICATION_CLASSES': ('rest_framework_simplejwt.authentication.JWTAuthentication',),
+    'DEFAULT_AUTHENTICATION_CLASSES': (
+        'accounts.authentication.ClaimsJWTAuthentication' if JWT_CLAIMS_AUTH
+        else 'rest_framework_simplejwt.authentication.JWTAuthentication',
+    ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
@@ -93,4 +115,6 @@ SPECTACULAR_SETTINGS = {
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
+    "TOKEN_OBTAIN_SERIALIZER": "accounts.serializers.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "accounts.serializers.ClaimsTokenRefreshSerializer",
 }